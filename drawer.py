@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 
+import itertools
 import pygame
 import random
 
@@ -25,6 +26,13 @@ class Drawer(object):
     self.max_x = max_x         # How many squares across.
     self.max_y = max_y         # How many qsuares down.
     self.score_text = None
+    # Pixel coords of the top left corner of every square, worked out once
+    # here instead of on every draw.
+    self.cells = {(x, y): (self.pixels(x), self.pixels(y))
+                  for x in range(max_x) for y in range(max_y)}
+    # This frame's (image, (pos_x, pos_y)) pairs, bucketed by layer. They all
+    # go to the screen in one blits() call in render().
+    self.draw_list = {}
 
   def set_background(self, rgb):
     """Set the background color.
@@ -42,8 +50,18 @@ class Drawer(object):
     font = pygame.font.SysFont("verdana", 16)
     self.score_text = font.render(message, True, (255, 255, 255))
 
+  def render(self):
+    """Put everything queued up by draw() onto the screen, lowest layer first."""
+    if self.draw_list:
+      self.screen.blits(
+          itertools.chain.from_iterable(
+              self.draw_list[layer] for layer in sorted(self.draw_list)),
+          doreturn=False)
+      self.draw_list.clear()
+
   def fill(self):
     """Completely fill the screen with the background color and any messages."""
+    self.render()
     self.display.blit(self.screen, (0, 0))
     self.display.blit(self.scorecard, (0, self.max_y * self.size))
     self.occupied.clear()
@@ -57,25 +75,38 @@ class Drawer(object):
                           ((self.max_x * self.size - self.score_text.get_width()) / 2,
                            (self.scorecard_size - self.score_text.get_height()) / 2))
 
-  def draw(self, image, x, y, obstacle=False):
-    """Put an image on the screen at some location.
+  def draw(self, image, x, y, obstacle=False, layer=0):
+    """Queue an image to be put on the screen at some location.
+
+    Nothing is drawn until render(); things on the same layer are drawn in the
+    order they were queued.
 
     Args:
       image: (pygame.Surface) Already-loaded image to draw.
       x, y: (int) Grid position, in squares.
       obstacle: (bool) whether the drawn thing stops other things from passing
                 over it.
+      layer: (int) things on higher layers are drawn on top.
+    """
+    self.draw_many(image, ((x, y),), obstacle, layer)
+
+  def draw_many(self, image, positions, obstacle=False, layer=0):
+    """Queue the same image to be put on the screen at lots of locations.
+
+    Args:
+      image: (pygame.Surface) Already-loaded image to draw.
+      positions: (iterable of (int, int)) Grid positions, in squares.
+      obstacle: (bool) whether the drawn things stop other things from passing
+                over them.
+      layer: (int) things on higher layers are drawn on top.
     """
-    pos_x = self.pixels(x)
-    pos_y = self.pixels(y)
-    # Hack alert! We're doubling the size of all the images here because they're
-    # 64px, we moved to 128px squares, and I'm too lazy to resize them. The
-    # square size is set in the constructor of moana.AmazingMoanaGame.
-    #self.screen.blit(pygame.transform.scale2x(image), (pos_x, pos_y))
-    self.screen.blit(image, (pos_x, pos_y))
-    self.occupied.add((x, y))
+    positions = list(positions)
+    cells = self.cells
+    self.draw_list.setdefault(layer, []).extend(
+        (image, cells[pos]) for pos in positions)
+    self.occupied.update(positions)
     if obstacle:
-      self.obstacles.add((x, y))
+      self.obstacles.update(positions)
 
   def pixels(self, index):
     """Take a grid square and returns coords of its top left hand corner.
@@ -4,18 +4,20 @@ import pygame
 
 class StationaryThings(object):
   """Any type of unmoving thing that appears on the grid."""
-  def __init__(self, image, drawer, obstacle=False):
+  def __init__(self, image, drawer, obstacle=False, layer=0):
     """Set up the thing to be drawn.
 
     Args:
       image: (pygame.Surface) a loaded image.
       drawer: (drawer.Drawer) an initialised Drawer to display images.
       obstacle: (bool) Does this thing prevent moveable things from passing it?
+      layer: (int) things on higher layers are drawn on top.
     """
     self.things = set()   # Set of (x, y) tuples, indexed by grid pos, not pixels
     self.drawer = drawer
     self.image = image
     self.obstacle = obstacle
+    self.layer = layer
 
   def add_at(self, pos):
     """Add a thing at a square on the grid.
@@ -42,8 +44,7 @@ class StationaryThings(object):
 
   def draw(self):
     """Instruct the drawer to put the things on the screen."""
-    for (x, y) in self.things:
-      self.drawer.draw(self.image, x, y, self.obstacle)
+    self.drawer.draw_many(self.image, self.things, self.obstacle, self.layer)
 
   def delete(self, pos):
     """Remove the thing at some position.
@@ -68,15 +69,17 @@ class StationaryThings(object):
 
 class MovingThing(object):
   """An icon that moves around."""
-  def __init__(self, image, drawer, x=-1, y=-1, capacity=8):
+  def __init__(self, image, drawer, x=-1, y=-1, capacity=8, layer=0):
     """Set up the icon that moves to find things.
 
     Args:
       image: (pygame.Surface) a loaded image
       drawer: (drawer.Drawer) an initialised Drawer to display images
       x: (int) which column to randomly draw this in
+      layer: (int) things on higher layers are drawn on top.
     """
     self.drawer = drawer
+    self.layer = layer
     self.image = image
     self.images = { "default" : image}
     dark = pygame.Surface(self.image.get_size()).convert_alpha()
@@ -145,7 +148,7 @@ class MovingThing(object):
 
   def draw(self):
     """Instruct the drawer to draw this thing at some location."""
-    self.drawer.draw(self.image, self.x, self.y)
+    self.drawer.draw(self.image, self.x, self.y, layer=self.layer)
 
   def move_up(self, avoid_obstacles=False):
     if self.frozen: